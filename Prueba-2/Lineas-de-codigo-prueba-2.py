@@ -1,8 +1,49 @@
 import os
 import json
 import re
+import sys
+import inspect
+import socket
 import ipaddress
 
+# Se usa la biblioteca JSON más rápida disponible; json de la biblioteca estándar es el respaldo.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+if orjson is not None:
+    MOTOR_JSON = "orjson"
+elif ujson is not None:
+    MOTOR_JSON = "ujson"
+else:
+    MOTOR_JSON = "json"
+
+INDENTACION_JSON = 2  # orjson solo admite 2 espacios; los demás motores usan la misma indentación
+
+def codificar_json(datos, indentar=False):
+    """Codifica los datos a JSON en bytes UTF-8; compacto por defecto o indentado si se solicita."""
+    if MOTOR_JSON == "orjson":
+        return orjson.dumps(datos, option=orjson.OPT_INDENT_2 if indentar else 0)
+    if MOTOR_JSON == "ujson":
+        return ujson.dumps(datos, ensure_ascii=False, escape_forward_slashes=False,
+                           indent=INDENTACION_JSON if indentar else 0).encode("utf-8")
+    if indentar:
+        return json.dumps(datos, ensure_ascii=False, indent=INDENTACION_JSON).encode("utf-8")
+    return json.dumps(datos, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+def decodificar_json(contenido):
+    """Decodifica un contenido JSON en bytes. Lanza ValueError si no es válido."""
+    if MOTOR_JSON == "orjson":
+        return orjson.loads(contenido)
+    if MOTOR_JSON == "ujson":
+        return ujson.loads(contenido)
+    return json.loads(contenido)
+
 class Campus:
     """Representa un campus con una descripción y una lista de dispositivos."""
     def __init__(self, nombre, descripcion):
@@ -21,6 +62,34 @@ class Dispositivo:
         self.vlans = vlans  # Diccionario de VLANs
         self.servicios = servicios  # Lista de servicios de red configurados
 
+class Esquema:
+    """Construye objetos de una clase a partir de diccionarios con los mismos campos que su constructor."""
+
+    def __init__(self, clase):
+        self.clase = clase
+        self.campos = tuple(inspect.signature(clase.__init__).parameters)[1:]  # Se omite self
+        self._conjunto = frozenset(self.campos)
+
+    def construir(self, datos):
+        """Crea un objeto usando el diccionario decodificado directamente como sus atributos.
+
+        El __init__ de la clase no se ejecuta a propósito; si se le agrega lógica,
+        también debe aplicarse aquí para los objetos cargados desde archivo.
+        """
+        if not isinstance(datos, dict):
+            raise ValueError(f"Se esperaba un objeto JSON para {self.clase.__name__}, se encontró {type(datos).__name__}")
+        if datos.keys() != self._conjunto:
+            faltantes = self._conjunto - datos.keys()
+            if faltantes:
+                raise KeyError(f"Faltan campos en {self.clase.__name__}: {', '.join(sorted(faltantes))}")
+            sobrantes = datos.keys() - self._conjunto
+            raise KeyError(f"Campos desconocidos en {self.clase.__name__}: {', '.join(sorted(sobrantes))}")
+        objeto = self.clase.__new__(self.clase)
+        objeto.__dict__ = datos
+        return objeto
+
+ESQUEMA_DISPOSITIVO = Esquema(Dispositivo)
+
 def es_direccion_ipv4(direccion):
     """Valida si una dirección IP es válida."""
     patron = re.compile(r'^(\d{1,3}\.){3}\d{1,3}$')
@@ -40,40 +109,344 @@ def es_direccion_ipv6(direccion):
     except ipaddress.AddressValueError:
         return False
 
+def separar_interfaces(texto):
+    """Separa una lista de interfaces escrita con comas, sin espacios, vacíos ni repetidas."""
+    return list(dict.fromkeys(interfaz.strip() for interfaz in texto.split(",") if interfaz.strip()))
+
+def obtener_red(ip, mask):
+    """Obtiene la subred a la que pertenece una IP a partir de su máscara."""
+    if ":" in str(mask):
+        # Las máscaras IPv6 se guardan en formato extendido; se convierten a prefijo.
+        mask = bin(int(ipaddress.IPv6Address(mask))).count("1")
+    return ipaddress.ip_interface(f"{ip}/{mask}").network
+
+def ip_a_entero(ip):
+    """Convierte una IP en texto a (versión, entero) sin crear objetos de ipaddress."""
+    version = 6 if ":" in ip else 4
+    try:
+        return version, int.from_bytes(socket.inet_pton(socket.AF_INET6 if version == 6 else socket.AF_INET, ip), "big")
+    except OSError:
+        raise ValueError(f"La dirección {ip} no es una IP válida.")
+
+class Subred:
+    """Lleva el control de las direcciones de host usadas en una subred mediante un mapa de bits.
+
+    Las direcciones se reciben y se retornan como enteros.
+    """
+
+    BITS_POR_BLOQUE = 4096  # Cantidad de direcciones representadas por cada bloque del mapa
+
+    def __init__(self, red):
+        self.red = red  # Objeto ipaddress de la subred
+        if red.prefixlen >= red.max_prefixlen - 1:
+            # Las redes /31, /32, /127 y /128 usan todas sus direcciones.
+            self.primera = int(red.network_address)
+            self.capacidad = red.num_addresses
+        else:
+            self.primera = int(red.network_address) + 1
+            self.capacidad = red.num_addresses - (2 if red.version == 4 else 1)
+        self.usadas = 0  # Cantidad de direcciones marcadas como usadas
+        self._bloques = {}  # Índice de bloque -> bytearray con un bit por dirección
+        self._ocupados = {}  # Índice de bloque -> cantidad de bits encendidos
+        self._cursor = 0  # Ninguna dirección anterior a este índice está libre
+        self.duenos = {}  # Dirección entera -> {campus: cantidad de registros de la IP}
+
+    def es_host(self, entero):
+        """Indica si una dirección es un host asignable de la subred."""
+        return 0 <= entero - self.primera < self.capacidad
+
+    def _indice(self, entero):
+        """Convierte una dirección en su índice dentro del mapa de bits."""
+        if not self.es_host(entero):
+            raise ValueError(f"La dirección {self.a_texto(entero)} no es un host válido de la subred {self.red}.")
+        return entero - self.primera
+
+    def esta_usada(self, entero):
+        """Indica si una dirección de la subred ya está asignada. Las que no son host nunca lo están."""
+        if not self.es_host(entero):
+            return False
+        bloque, desplazamiento = divmod(entero - self.primera, self.BITS_POR_BLOQUE)
+        bits = self._bloques.get(bloque)
+        return bits is not None and bool(bits[desplazamiento >> 3] & (1 << (desplazamiento & 7)))
+
+    def marcar(self, entero):
+        """Marca una dirección como usada. Retorna False si ya lo estaba."""
+        return self._marcar_indice(self._indice(entero))
+
+    def _marcar_indice(self, indice):
+        """Enciende el bit de un índice del mapa. Retorna False si ya estaba encendido."""
+        bloque, desplazamiento = divmod(indice, self.BITS_POR_BLOQUE)
+        bits = self._bloques.get(bloque)
+        if bits is None:
+            bits = self._bloques[bloque] = bytearray(self.BITS_POR_BLOQUE // 8)
+            self._ocupados[bloque] = 0
+        bit = 1 << (desplazamiento & 7)
+        if bits[desplazamiento >> 3] & bit:
+            return False
+        bits[desplazamiento >> 3] |= bit
+        self._ocupados[bloque] += 1
+        self.usadas += 1
+        return True
+
+    def liberar(self, entero):
+        """Libera una dirección usada. Retorna False si no estaba asignada."""
+        indice = self._indice(entero)
+        bloque, desplazamiento = divmod(indice, self.BITS_POR_BLOQUE)
+        bits = self._bloques.get(bloque)
+        bit = 1 << (desplazamiento & 7)
+        if bits is None or not bits[desplazamiento >> 3] & bit:
+            return False
+        bits[desplazamiento >> 3] &= ~bit
+        self._ocupados[bloque] -= 1
+        if not self._ocupados[bloque]:
+            del self._bloques[bloque]
+            del self._ocupados[bloque]
+        self.usadas -= 1
+        self._cursor = min(self._cursor, indice)
+        return True
+
+    def _buscar_libre(self):
+        """Busca el primer índice libre a partir del cursor, saltando bloques y bytes llenos."""
+        indice = self._cursor
+        while indice < self.capacidad:
+            bloque, desplazamiento = divmod(indice, self.BITS_POR_BLOQUE)
+            bits = self._bloques.get(bloque)
+            if bits is None:
+                return indice
+            if self._ocupados[bloque] < self.BITS_POR_BLOQUE:
+                for posicion in range(desplazamiento >> 3, len(bits)):
+                    valor = bits[posicion]
+                    if valor == 0xFF:
+                        continue
+                    inicio = desplazamiento & 7 if posicion == desplazamiento >> 3 else 0
+                    for bit in range(inicio, 8):
+                        if not valor & (1 << bit):
+                            indice = bloque * self.BITS_POR_BLOQUE + posicion * 8 + bit
+                            return indice if indice < self.capacidad else None
+            indice = (bloque + 1) * self.BITS_POR_BLOQUE
+        return None
+
+    def siguientes_libres(self, cantidad=1):
+        """Marca como usadas y retorna las siguientes `cantidad` direcciones libres de la subred."""
+        if cantidad > self.capacidad - self.usadas:
+            raise ValueError(f"La subred {self.red} no tiene {cantidad} direcciones libres.")
+        enteros = []
+        for _ in range(cantidad):
+            indice = self._buscar_libre()
+            self._marcar_indice(indice)
+            self._cursor = indice + 1
+            enteros.append(self.primera + indice)
+        return enteros
+
+    def a_texto(self, entero):
+        """Convierte una dirección entera de la subred a texto."""
+        return str(ipaddress.IPv4Address(entero) if self.red.version == 4 else ipaddress.IPv6Address(entero))
+
+    def utilizacion(self):
+        """Retorna el porcentaje de direcciones usadas de la subred."""
+        return 100 * self.usadas / self.capacidad if self.capacidad else 0.0
+
+class AsignadorIPs:
+    """Mantiene las subredes conocidas y asigna direcciones libres en ellas.
+
+    Cada dirección usada cuenta cuántas veces la registró cada campus, de modo que una IP
+    repetida solo se libera cuando la suelta su último dueño.
+    """
+
+    def __init__(self):
+        self.subredes = {}  # Red -> Subred
+        self.por_campus = {}  # Nombre del campus -> {Subred: cantidad de IPs usadas}
+        self._por_clave = {}  # (versión, red entera, prefijo) -> Subred
+        self._mascaras = {}  # (máscara, versión) -> (máscara entera, prefijo)
+
+    def obtener_subred(self, red):
+        """Retorna la Subred asociada a una red, creándola si no existe."""
+        red = ipaddress.ip_network(red, strict=False)
+        clave = (red.version, int(red.network_address), red.prefixlen)
+        subred = self._por_clave.get(clave)
+        if subred is None:
+            subred = self._por_clave[clave] = self.subredes[red] = Subred(red)
+        return subred
+
+    def _ubicar(self, ip, mask, crear=False):
+        """Retorna la Subred de una IP y la IP como entero, calculando la red con la máscara en caché.
+
+        Si la subred no existe se retorna None, salvo con `crear`, que la crea solo cuando la IP
+        es un host válido de ella; así las consultas y liberaciones no dejan subredes vacías.
+        """
+        version, entero = ip_a_entero(ip)
+        mascara = self._mascaras.get((mask, version))
+        if mascara is None:
+            prefijo = obtener_red("::" if version == 6 else "0.0.0.0", mask).prefixlen
+            ancho = 128 if version == 6 else 32
+            mascara = self._mascaras[(mask, version)] = (((1 << prefijo) - 1) << (ancho - prefijo), prefijo)
+        clave = (version, entero & mascara[0], mascara[1])
+        subred = self._por_clave.get(clave)
+        if subred is None and crear:
+            clase = ipaddress.IPv6Network if version == 6 else ipaddress.IPv4Network
+            nueva = Subred(clase((clave[1], clave[2])))
+            nueva._indice(entero)  # Lanza ValueError si la IP no es un host de la subred
+            subred = self._por_clave[clave] = self.subredes[nueva.red] = nueva
+        return subred, entero
+
+    def _contar(self, nombre_campus, subred, cantidad):
+        """Actualiza el conteo de IPs usadas por un campus en una subred; nunca guarda valores negativos."""
+        subredes = self.por_campus.setdefault(nombre_campus, {})
+        total = subredes.get(subred, 0) + cantidad
+        if total > 0:
+            subredes[subred] = total
+        else:
+            subredes.pop(subred, None)
+            if not subredes:
+                del self.por_campus[nombre_campus]
+
+    def registrar(self, nombre_campus, ip, mask):
+        """Marca una IP como usada por un campus. Retorna False si ya estaba en uso."""
+        subred, entero = self._ubicar(ip, mask, crear=True)
+        duenos = subred.duenos.get(entero)
+        if duenos is None:
+            subred.marcar(entero)
+            subred.duenos[entero] = {nombre_campus: 1}
+            self._contar(nombre_campus, subred, 1)
+            return True
+        if nombre_campus not in duenos:
+            self._contar(nombre_campus, subred, 1)
+        duenos[nombre_campus] = duenos.get(nombre_campus, 0) + 1
+        return False
+
+    def liberar(self, nombre_campus, ip, mask):
+        """Quita un registro de la IP hecho por el campus. Retorna False si el campus no la tenía."""
+        subred, entero = self._ubicar(ip, mask)
+        if subred is None:
+            return False
+        duenos = subred.duenos.get(entero)
+        if duenos is None or nombre_campus not in duenos:
+            return False
+        duenos[nombre_campus] -= 1
+        if not duenos[nombre_campus]:
+            del duenos[nombre_campus]
+            self._contar(nombre_campus, subred, -1)
+        if not duenos:
+            del subred.duenos[entero]
+            subred.liberar(entero)
+        return True
+
+    def esta_usada(self, ip, mask):
+        """Indica si una IP ya está asignada en su subred. Las direcciones de red o broadcast retornan False."""
+        subred, entero = self._ubicar(ip, mask)
+        return subred is not None and subred.esta_usada(entero)
+
+    def asignar(self, nombre_campus, red, cantidad=1):
+        """Asigna las siguientes IPs libres de una red a un campus y retorna la lista de (ip, mascara)."""
+        subred = self.obtener_subred(red)
+        enteros = subred.siguientes_libres(cantidad)
+        for entero in enteros:
+            subred.duenos[entero] = {nombre_campus: 1}
+        self._contar(nombre_campus, subred, cantidad)
+        mask = str(subred.red.netmask)
+        return [(subred.a_texto(entero), mask) for entero in enteros]
+
+    def registrar_dispositivo(self, nombre_campus, dispositivo):
+        """Marca como usadas todas las IPs de un dispositivo. Retorna las IPs que ya estaban en uso."""
+        repetidas = []
+        for ip, mask in dispositivo.ips_masks.values():
+            try:
+                if not self.registrar(nombre_campus, ip, mask):
+                    repetidas.append(ip)
+            except ValueError:
+                # Direcciones de red o broadcast no ocupan un host de la subred.
+                continue
+        return repetidas
+
+    def liberar_dispositivo(self, nombre_campus, dispositivo):
+        """Libera todas las IPs de un dispositivo."""
+        for ip, mask in dispositivo.ips_masks.values():
+            try:
+                self.liberar(nombre_campus, ip, mask)
+            except ValueError:
+                continue
+
+    def reporte(self):
+        """Genera un texto con la utilización de cada subred y de cada campus."""
+        texto = "Utilización por subred:\n"
+        for red, subred in sorted(self.subredes.items(), key=lambda item: (item[0].version, item[0])):
+            texto += f"- {red}: {subred.usadas}/{subred.capacidad} ({subred.utilizacion():.2f}%)\n"
+        texto += "Utilización por campus:\n"
+        for nombre_campus, subredes in sorted(self.por_campus.items()):
+            texto += f"Campus: {nombre_campus}\n"
+            for subred, cantidad in subredes.items():
+                texto += f"  - {subred.red}: {cantidad} IPs usadas ({100 * cantidad / subred.capacidad:.2f}% de la subred)\n"
+        return texto
+
 class AdministradorRedes:
     """Clase principal para administrar campus y dispositivos de red."""
     
-    def __init__(self, nombre_archivo):
+    def __init__(self, nombre_archivo, indentar=False):
         self.nombre_archivo = nombre_archivo
+        self.indentar = indentar  # Guarda el JSON indentado en lugar de compacto
         self.campus = {}
+        self._asignador = None  # AsignadorIPs, se construye en el primer uso
         self.cargar_desde_archivo()
 
+    def obtener_asignador(self):
+        """Retorna el asignador de IPs, construyéndolo con todos los dispositivos la primera vez."""
+        if self._asignador is None:
+            self.reconstruir_asignador()
+        return self._asignador
+
+    def reconstruir_asignador(self):
+        """Construye el asignador de IPs a partir de los dispositivos de todos los campus."""
+        self._asignador = AsignadorIPs()
+        for nombre, campus in self.campus.items():
+            for dispositivo in campus.dispositivos:
+                for ip in self._asignador.registrar_dispositivo(nombre, dispositivo):
+                    print(f"Advertencia: la IP {ip} del dispositivo {dispositivo.nombre} ya está en uso.")
+
     def cargar_desde_archivo(self):
         """Carga los datos de campus y dispositivos desde el archivo JSON."""
         if not os.path.exists(self.nombre_archivo):
             return
 
-        with open(self.nombre_archivo, "r") as archivo:
+        self._asignador = None
+        with open(self.nombre_archivo, "rb") as archivo:
             try:
-                datos = json.load(archivo)
+                datos = decodificar_json(archivo.read())
+                if not isinstance(datos, dict):
+                    raise ValueError("el contenido no es un objeto JSON")
+                construir = ESQUEMA_DISPOSITIVO.construir
                 for nombre, descripcion in datos.get("campus", {}).items():
                     campus = Campus(nombre, descripcion)
                     self.campus[nombre] = campus
-                    for dispositivo_info in datos.get(nombre, []):
-                        dispositivo = Dispositivo(**dispositivo_info)
-                        campus.dispositivos.append(dispositivo)
-            except (json.JSONDecodeError, KeyError) as e:
+                    campus.dispositivos = [construir(dispositivo_info) for dispositivo_info in datos.get(nombre, [])]
+            except (ValueError, KeyError) as e:
                 print(f"Error al leer el archivo {self.nombre_archivo}: {e}")
 
     def guardar_en_archivo(self):
-        """Guarda los datos en un archivo JSON."""
+        """Guarda los datos en un archivo JSON. Retorna False si no se pudieron guardar.
+
+        El contenido se codifica antes de tocar el archivo y se escribe en un archivo temporal
+        que luego reemplaza al original, para no dejarlo vacío si algo falla.
+        """
         datos = {"campus": {}}
         for nombre, campus in self.campus.items():
             datos["campus"][nombre] = campus.descripcion
             datos[nombre] = [dispositivo.__dict__ for dispositivo in campus.dispositivos]
 
-        with open(self.nombre_archivo, "w") as archivo:
-            json.dump(datos, archivo, indent=4)
+        try:
+            contenido = codificar_json(datos, self.indentar)
+        except (TypeError, ValueError) as e:
+            # orjson, por ejemplo, rechaza enteros de más de 64 bits.
+            print(f"Error al codificar los datos, el archivo {self.nombre_archivo} no se modificó: {e}")
+            return False
+        archivo_temporal = f"{self.nombre_archivo}.tmp"
+        try:
+            with open(archivo_temporal, "wb") as archivo:
+                archivo.write(contenido)
+            os.replace(archivo_temporal, self.nombre_archivo)
+        except OSError as e:
+            print(f"Error al escribir en el archivo {self.nombre_archivo}: {e}")
+            return False
+        return True
 
     def convertir_a_formato_texto(self):
         """Convierte los datos a formato de texto legible."""
@@ -97,8 +470,8 @@ class AdministradorRedes:
 
     def guardar_y_convertir_datos(self):
         """Guarda los datos en JSON y luego los convierte a texto."""
-        self.guardar_en_archivo()
-        print("Datos guardados en formato JSON.")
+        if self.guardar_en_archivo():
+            print("Datos guardados en formato JSON.")
 
         while True:
             archivo_texto = input("Ingrese el nombre del archivo de texto para guardar los datos convertidos: ")
@@ -124,7 +497,8 @@ class AdministradorRedes:
             "2": self.administrar_dispositivos,
             "3": self.guardar_y_convertir_datos,
             "4": self.ver_campus,
-            "5": self.salir
+            "5": self.ver_utilizacion_ips,
+            "6": self.salir
         }
 
         while True:
@@ -134,7 +508,8 @@ class AdministradorRedes:
             print("2. Administrar dispositivos de red")
             print("3. Guardar y convertir datos")
             print("4. Ver campus y dispositivos")
-            print("5. Salir")
+            print("5. Ver utilización de direcciones IP")
+            print("6. Salir")
             opcion = input("Seleccione una opción: ")
 
             if opcion in opciones:
@@ -195,6 +570,9 @@ class AdministradorRedes:
         """Elimina un campus existente de la instancia de la clase."""
         nombre = input("Ingrese el nombre del campus que desea borrar: ")
         if nombre in self.campus:
+            if self._asignador is not None:
+                for dispositivo in self.campus[nombre].dispositivos:
+                    self._asignador.liberar_dispositivo(nombre, dispositivo)
             del self.campus[nombre]
             input("Campus eliminado. Presione Enter para continuar.")
         else:
@@ -236,9 +614,8 @@ class AdministradorRedes:
         nombre = input("Ingrese el nombre del dispositivo: ")
         modelo = input("Ingrese el modelo del dispositivo: ")
         capa = self.seleccionar_capa()
-        interfaces = input("Ingrese las interfaces de red del dispositivo (separadas por coma): ").split(",")
-        interfaces = [interface.strip() for interface in interfaces if interface.strip()]
-        ips_masks = self.ingresar_ips_masks(interfaces)
+        interfaces = separar_interfaces(input("Ingrese las interfaces de red del dispositivo (separadas por coma): "))
+        ips_masks = self.ingresar_ips_masks(interfaces, nombre_campus)
         vlans = self.ingresar_vlans()
         servicios = input("Ingrese los servicios de red configurados (separados por coma): ").split(",")
         servicios = [servicio.strip() for servicio in servicios if servicio.strip()]
@@ -273,20 +650,43 @@ class AdministradorRedes:
             else:
                 print("Opción no válida. Inténtelo de nuevo.")
 
-    def ingresar_ips_masks(self, interfaces):
-        """Solicita al usuario ingresar las direcciones IP y máscaras de red para las interfaces de un dispositivo."""
+    def ingresar_ips_masks(self, interfaces, nombre_campus):
+        """Solicita al usuario ingresar las direcciones IP y máscaras de red para las interfaces de un dispositivo.
+
+        Cada IP ingresada o asignada automáticamente queda registrada como usada en el asignador.
+        """
+        asignador = self.obtener_asignador()
         ips_masks = {}
-        for interfaz in interfaces:
+        # Una interfaz repetida registraría una IP que luego se pierde al sobrescribirla.
+        for interfaz in dict.fromkeys(interfaces):
             while True:
-                ip = input(f"Ingrese la dirección IP para la interfaz {interfaz}: ")
-                if es_direccion_ipv4(ip) or es_direccion_ipv6(ip):
+                ip = input(f"Ingrese la dirección IP para la interfaz {interfaz} (o 'auto' para asignar la siguiente libre): ")
+                if ip.lower() == "auto":
+                    red = input("Ingrese la subred de la que se asignará la IP (ej. 192.168.1.0/24): ")
+                    try:
+                        ips_masks[interfaz] = asignador.asignar(nombre_campus, red)[0]
+                        print(f"IP asignada a la interfaz {interfaz}: {ips_masks[interfaz][0]}")
+                        break
+                    except ValueError as e:
+                        print(f"No se pudo asignar una IP: {e}")
+                elif es_direccion_ipv4(ip) or es_direccion_ipv6(ip):
                     mask = input(f"Ingrese la máscara de red para la interfaz {interfaz}: ")
                     try:
                         ip_obj = ipaddress.ip_interface(f"{ip}/{mask}")
-                        ips_masks[interfaz] = (str(ip_obj.ip), str(ip_obj.netmask))
-                        break
                     except ValueError:
                         print("Máscara de red no válida. Inténtelo nuevamente.")
+                        continue
+                    ip, mask = str(ip_obj.ip), str(ip_obj.netmask)
+                    if asignador.esta_usada(ip, mask):
+                        print("La dirección IP ya está en uso. Inténtelo nuevamente.")
+                        continue
+                    ips_masks[interfaz] = (ip, mask)
+                    try:
+                        asignador.registrar(nombre_campus, ip, mask)
+                    except ValueError:
+                        # Direcciones de red o broadcast no se controlan en el asignador.
+                        pass
+                    break
                 else:
                     print("Dirección IP no válida. Inténtelo nuevamente.")
         return ips_masks
@@ -312,14 +712,21 @@ class AdministradorRedes:
             if dispositivo.nombre == nombre_dispositivo:
                 modelo = input(f"Ingrese el nuevo modelo del dispositivo (actual: {dispositivo.modelo}): ")
                 capa = self.seleccionar_capa()
-                nuevas_interfaces = input("Ingrese las nuevas interfaces de red del dispositivo (separadas por coma): ").split(",")
-                nuevas_ips_masks = self.ingresar_ips_masks(nuevas_interfaces)
+                nuevas_interfaces = separar_interfaces(input("Ingrese las nuevas interfaces de red del dispositivo (separadas por coma): "))
+                for interfaz in nuevas_interfaces:
+                    if interfaz in dispositivo.ips_masks:
+                        ip, mask = dispositivo.ips_masks[interfaz]
+                        try:
+                            self.obtener_asignador().liberar(nombre_campus, ip, mask)
+                        except ValueError:
+                            pass
+                nuevas_ips_masks = self.ingresar_ips_masks(nuevas_interfaces, nombre_campus)
                 nuevas_vlans = self.ingresar_vlans()
                 nuevos_servicios = input(f"Ingrese los nuevos servicios de red configurados (actual: {', '.join(dispositivo.servicios)}): ").split(",")
 
                 dispositivo.modelo = modelo
                 dispositivo.capa = capa
-                dispositivo.interfaces.extend(nuevas_interfaces)
+                dispositivo.interfaces.extend(interfaz for interfaz in nuevas_interfaces if interfaz not in dispositivo.interfaces)
                 dispositivo.ips_masks.update(nuevas_ips_masks)
                 dispositivo.vlans.update(nuevas_vlans)
                 dispositivo.servicios = nuevos_servicios
@@ -370,11 +777,18 @@ class AdministradorRedes:
                 print("  " + "-" * 30)
         input("Presione Enter para continuar.")
 
+    def ver_utilizacion_ips(self):
+        """Muestra la utilización de direcciones IP por subred y por campus."""
+        print(self.obtener_asignador().reporte())
+        input("Presione Enter para continuar.")
+
     def borrar_dispositivo(self, nombre_campus):
         """Elimina un dispositivo existente de un campus."""
         nombre_dispositivo = input("Ingrese el nombre del dispositivo que desea borrar: ")
         for dispositivo in self.campus[nombre_campus].dispositivos:
             if dispositivo.nombre == nombre_dispositivo:
+                if self._asignador is not None:
+                    self._asignador.liberar_dispositivo(nombre_campus, dispositivo)
                 self.campus[nombre_campus].dispositivos.remove(dispositivo)
                 print("Dispositivo eliminado.")
                 input("Presione Enter para continuar.")
@@ -383,5 +797,6 @@ class AdministradorRedes:
         input("Presione Enter para continuar.")
 
 if __name__ == "__main__":
-    administrador = AdministradorRedes("datos_redes.json")
+    # Con --indentar el archivo JSON se guarda legible en lugar de compacto.
+    administrador = AdministradorRedes("datos_redes.json", indentar="--indentar" in sys.argv[1:])
     administrador.menu_principal()
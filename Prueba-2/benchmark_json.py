@@ -0,0 +1,93 @@
+"""Compara la carga y el guardado de AdministradorRedes con el método anterior (json estándar, indent=4).
+
+Uso: python benchmark_json.py [cantidad_de_dispositivos ...]
+"""
+import importlib.util
+import json
+import os
+import sys
+import tempfile
+import time
+
+RUTA_MODULO = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Lineas-de-codigo-prueba-2.py")
+especificacion = importlib.util.spec_from_file_location("administrador_redes", RUTA_MODULO)
+redes = importlib.util.module_from_spec(especificacion)
+especificacion.loader.exec_module(redes)
+
+DISPOSITIVOS_POR_CAMPUS = 1000
+
+def generar_datos(cantidad):
+    """Genera datos con la misma estructura que guarda AdministradorRedes."""
+    datos = {"campus": {}}
+    for i in range(cantidad):
+        nombre_campus = f"Campus {i // DISPOSITIVOS_POR_CAMPUS}"
+        if nombre_campus not in datos["campus"]:
+            datos["campus"][nombre_campus] = f"Descripción del {nombre_campus}"
+            datos[nombre_campus] = []
+        datos[nombre_campus].append({
+            "nombre": f"Dispositivo {i}",
+            "modelo": "Cisco Catalyst 9300",
+            "capa": "Acceso",
+            "interfaces": ["Gi0/0", "Gi0/1"],
+            "ips_masks": {
+                "Gi0/0": [f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}", "255.0.0.0"],
+                "Gi0/1": [f"2001:db8::{i >> 16:x}:{i & 0xffff:x}", "ffff:ffff:ffff:ffff::"],
+            },
+            "vlans": {"Datos": 10, "Voz": 20},
+            "servicios": ["DHCP", "SSH"],
+        })
+    return datos
+
+def cargar_anterior(nombre_archivo):
+    """Carga como lo hacía AdministradorRedes antes de la capa JSON rápida."""
+    campus = {}
+    with open(nombre_archivo, "r") as archivo:
+        datos = json.load(archivo)
+    for nombre, descripcion in datos.get("campus", {}).items():
+        campus[nombre] = redes.Campus(nombre, descripcion)
+        for dispositivo_info in datos.get(nombre, []):
+            campus[nombre].dispositivos.append(redes.Dispositivo(**dispositivo_info))
+    return campus
+
+def guardar_anterior(nombre_archivo, campus):
+    """Guarda como lo hacía AdministradorRedes antes de la capa JSON rápida."""
+    datos = {"campus": {}}
+    for nombre, c in campus.items():
+        datos["campus"][nombre] = c.descripcion
+        datos[nombre] = [dispositivo.__dict__ for dispositivo in c.dispositivos]
+    with open(nombre_archivo, "w") as archivo:
+        json.dump(datos, archivo, indent=4)
+
+def medir(funcion, *argumentos, repeticiones=3):
+    """Retorna el menor tiempo en segundos de varias ejecuciones de la función."""
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion(*argumentos)
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+def main(cantidades):
+    """Muestra los tiempos de guardado y carga de AdministradorRedes frente al método anterior."""
+    print(f"Motor JSON: {redes.MOTOR_JSON}")
+    with tempfile.TemporaryDirectory() as directorio:
+        archivo_anterior = os.path.join(directorio, "anterior.json")
+        archivo_nuevo = os.path.join(directorio, "nuevo.json")
+        for cantidad in cantidades:
+            with open(archivo_nuevo, "wb") as archivo:
+                archivo.write(redes.codificar_json(generar_datos(cantidad)))
+            administrador = redes.AdministradorRedes(archivo_nuevo)
+            t_guardar_anterior = medir(guardar_anterior, archivo_anterior, administrador.campus)
+            t_guardar_nuevo = medir(administrador.guardar_en_archivo)
+            t_cargar_anterior = medir(cargar_anterior, archivo_anterior)
+            t_cargar_nuevo = medir(redes.AdministradorRedes, archivo_nuevo)
+            # El asignador de IPs no forma parte de la carga; se construye al usarlo por primera vez.
+            t_asignador = medir(administrador.reconstruir_asignador)
+            print(f"\n{cantidad} dispositivos:")
+            print(f"  Tamaño: {os.path.getsize(archivo_anterior) / 1e6:.1f} MB -> {os.path.getsize(archivo_nuevo) / 1e6:.1f} MB")
+            print(f"  Guardar: {t_guardar_anterior:.3f} s -> {t_guardar_nuevo:.3f} s ({t_guardar_anterior / t_guardar_nuevo:.1f}x)")
+            print(f"  Cargar:  {t_cargar_anterior:.3f} s -> {t_cargar_nuevo:.3f} s ({t_cargar_anterior / t_cargar_nuevo:.1f}x)")
+            print(f"  Asignador de IPs (primer uso): {t_asignador:.3f} s")
+
+if __name__ == "__main__":
+    main([int(cantidad) for cantidad in sys.argv[1:]] or [10000, 100000])
@@ -0,0 +1,189 @@
+"""Pruebas del mapa de bits de Subred y del AsignadorIPs."""
+import importlib.util
+import ipaddress
+import os
+
+import pytest
+
+RUTA_MODULO = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Lineas-de-codigo-prueba-2.py")
+especificacion = importlib.util.spec_from_file_location("administrador_redes", RUTA_MODULO)
+redes = importlib.util.module_from_spec(especificacion)
+especificacion.loader.exec_module(redes)
+
+def crear_subred(red):
+    return redes.Subred(ipaddress.ip_network(red))
+
+def entero(ip):
+    return int(ipaddress.ip_address(ip))
+
+def textos(subred, enteros):
+    return [subred.a_texto(e) for e in enteros]
+
+def test_asigna_hosts_en_orden_sin_red_ni_broadcast():
+    subred = crear_subred("192.168.1.0/24")
+    assert subred.capacidad == 254
+    assert textos(subred, subred.siguientes_libres(3)) == ["192.168.1.1", "192.168.1.2", "192.168.1.3"]
+    assert subred.usadas == 3
+
+@pytest.mark.parametrize("red, esperadas", [
+    ("10.0.0.0/30", ["10.0.0.1", "10.0.0.2"]),
+    ("10.0.0.0/31", ["10.0.0.0", "10.0.0.1"]),
+    ("10.0.0.7/32", ["10.0.0.7"]),
+    ("2001:db8::/127", ["2001:db8::", "2001:db8::1"]),
+    ("2001:db8::5/128", ["2001:db8::5"]),
+    ("2001:db8::/126", ["2001:db8::1", "2001:db8::2", "2001:db8::3"]),
+])
+def test_redes_pequenas_usan_todas_sus_direcciones_validas(red, esperadas):
+    subred = crear_subred(red)
+    assert subred.capacidad == len(esperadas)
+    assert textos(subred, subred.siguientes_libres(len(esperadas))) == esperadas
+    with pytest.raises(ValueError):
+        subred.siguientes_libres()
+
+def test_liberar_mueve_el_cursor_hacia_atras():
+    subred = crear_subred("10.0.0.0/24")
+    subred.siguientes_libres(5)
+    assert subred.liberar(entero("10.0.0.2"))
+    assert not subred.liberar(entero("10.0.0.2"))
+    assert textos(subred, subred.siguientes_libres(2)) == ["10.0.0.2", "10.0.0.6"]
+
+def test_salta_direcciones_marcadas_por_delante_del_cursor():
+    subred = crear_subred("10.0.0.0/24")
+    for i in range(1, 18):
+        subred.marcar(entero(f"10.0.0.{i}"))
+    subred.marcar(entero("10.0.0.19"))
+    assert textos(subred, subred.siguientes_libres(2)) == ["10.0.0.18", "10.0.0.20"]
+
+def test_salta_bloques_llenos():
+    subred = crear_subred("10.0.0.0/16")
+    bloque = redes.Subred.BITS_POR_BLOQUE
+    for indice in range(bloque + 3):
+        subred.marcar(subred.primera + indice)
+    assert subred.siguientes_libres() == [subred.primera + bloque + 3]
+    assert subred.liberar(subred.primera + 10)
+    assert subred.siguientes_libres(2) == [subred.primera + 10, subred.primera + bloque + 4]
+
+def test_ultimo_bloque_parcial():
+    subred = crear_subred("10.0.0.0/22")
+    assert subred.capacidad == 1022
+    asignadas = subred.siguientes_libres(1022)
+    assert subred.a_texto(asignadas[-1]) == "10.0.3.254"
+    assert subred.utilizacion() == 100.0
+    with pytest.raises(ValueError):
+        subred.siguientes_libres()
+    subred.liberar(entero("10.0.3.254"))
+    assert textos(subred, subred.siguientes_libres()) == ["10.0.3.254"]
+
+def test_direcciones_fuera_de_los_hosts():
+    subred = crear_subred("10.0.0.0/24")
+    assert not subred.esta_usada(entero("10.0.0.0"))
+    assert not subred.esta_usada(entero("10.0.0.255"))
+    with pytest.raises(ValueError):
+        subred.marcar(entero("10.0.0.255"))
+
+def test_ipv6_grande_marca_direcciones_lejanas():
+    subred = crear_subred("2001:db8::/64")
+    assert subred.marcar(entero("2001:db8::ffff:ffff:ffff:fff0"))
+    assert textos(subred, subred.siguientes_libres()) == ["2001:db8::1"]
+    assert subred.usadas == 2
+    assert subred.esta_usada(entero("2001:db8::ffff:ffff:ffff:fff0"))
+
+def test_asignador_registra_mascaras_ipv4_e_ipv6():
+    asignador = redes.AsignadorIPs()
+    assert asignador.registrar("A", "10.0.0.5", "255.255.255.0")
+    assert asignador.registrar("A", "2001:db8::5", "ffff:ffff:ffff:ffff::")
+    assert asignador.esta_usada("10.0.0.5", "255.255.255.0")
+    assert asignador.esta_usada("2001:db8::5", "ffff:ffff:ffff:ffff::")
+    assert set(asignador.subredes) == {ipaddress.ip_network("10.0.0.0/24"), ipaddress.ip_network("2001:db8::/64")}
+
+def test_asignador_esta_usada_es_falso_para_red_y_broadcast():
+    asignador = redes.AsignadorIPs()
+    asignador.registrar("A", "10.0.0.5", "255.255.255.0")
+    assert not asignador.esta_usada("10.0.0.0", "255.255.255.0")
+    assert not asignador.esta_usada("10.0.0.255", "255.255.255.0")
+    with pytest.raises(ValueError):
+        asignador.registrar("A", "10.0.0.255", "255.255.255.0")
+
+def test_asignar_liberar_y_reasignar():
+    asignador = redes.AsignadorIPs()
+    assert asignador.asignar("A", "10.0.0.0/24", 2) == [("10.0.0.1", "255.255.255.0"), ("10.0.0.2", "255.255.255.0")]
+    assert asignador.liberar("A", "10.0.0.1", "255.255.255.0")
+    assert asignador.asignar("B", "10.0.0.0/24") == [("10.0.0.1", "255.255.255.0")]
+    subred = asignador.obtener_subred("10.0.0.0/24")
+    assert asignador.por_campus == {"A": {subred: 1}, "B": {subred: 1}}
+
+def test_ip_repetida_no_se_libera_mientras_otro_dueno_la_use():
+    asignador = redes.AsignadorIPs()
+    d1 = redes.Dispositivo("d1", "m", "Acceso", ["g0"], {"g0": ["10.0.0.5", "255.255.255.0"]}, {}, [])
+    d2 = redes.Dispositivo("d2", "m", "Acceso", ["g0"], {"g0": ["10.0.0.5", "255.255.255.0"]}, {}, [])
+    assert asignador.registrar_dispositivo("A", d1) == []
+    assert asignador.registrar_dispositivo("B", d2) == ["10.0.0.5"]
+    subred = asignador.obtener_subred("10.0.0.0/24")
+
+    asignador.liberar_dispositivo("B", d2)
+    assert asignador.esta_usada("10.0.0.5", "255.255.255.0")
+    assert asignador.por_campus == {"A": {subred: 1}}
+    assert asignador.asignar("C", "10.0.0.0/24", 5)[-1][0] == "10.0.0.6"
+
+    # Liberar de nuevo o desde un campus que no es dueño no cambia nada.
+    asignador.liberar_dispositivo("B", d2)
+    assert not asignador.liberar("Z", "10.0.0.5", "255.255.255.0")
+    assert asignador.por_campus["A"] == {subred: 1}
+
+    asignador.liberar_dispositivo("A", d1)
+    assert not asignador.esta_usada("10.0.0.5", "255.255.255.0")
+    assert "A" not in asignador.por_campus
+
+def test_ip_repetida_en_el_mismo_campus_cuenta_una_vez():
+    asignador = redes.AsignadorIPs()
+    assert asignador.registrar("A", "10.0.0.5", "255.255.255.0")
+    assert not asignador.registrar("A", "10.0.0.5", "255.255.255.0")
+    subred = asignador.obtener_subred("10.0.0.0/24")
+    assert asignador.por_campus == {"A": {subred: 1}}
+    assert asignador.liberar("A", "10.0.0.5", "255.255.255.0")
+    assert asignador.esta_usada("10.0.0.5", "255.255.255.0")
+    assert asignador.liberar("A", "10.0.0.5", "255.255.255.0")
+    assert not asignador.esta_usada("10.0.0.5", "255.255.255.0")
+    assert asignador.por_campus == {}
+
+def test_consultas_y_liberaciones_no_crean_subredes():
+    asignador = redes.AsignadorIPs()
+    asignador.registrar("A", "10.0.0.5", "255.255.255.0")
+    assert not asignador.esta_usada("172.16.0.9", "255.255.0.0")
+    assert not asignador.liberar("A", "192.168.0.9", "255.255.255.0")
+    with pytest.raises(ValueError):
+        asignador.registrar("A", "172.17.0.0", "255.255.0.0")
+    assert list(asignador.subredes) == [ipaddress.ip_network("10.0.0.0/24")]
+    assert "172.16" not in asignador.reporte()
+
+def test_separar_interfaces_quita_espacios_vacios_y_repetidas():
+    assert redes.separar_interfaces(" g0, g1,,g0 , g1 ") == ["g0", "g1"]
+
+def responder(monkeypatch, respuestas):
+    respuestas = iter(respuestas)
+    monkeypatch.setattr("builtins.input", lambda mensaje="": next(respuestas))
+
+def test_agregar_y_modificar_dispositivo_no_pierden_ips(tmp_path, monkeypatch):
+    administrador = redes.AdministradorRedes(str(tmp_path / "datos.json"))
+    administrador.campus["A"] = redes.Campus("A", "d")
+    responder(monkeypatch, [
+        "R1", "m", "3", "g0, g0", "10.0.0.1", "24", "fin", "SSH", "",
+    ])
+    administrador.agregar_dispositivos("A")
+    dispositivo = administrador.campus["A"].dispositivos[0]
+    assert dispositivo.interfaces == ["g0"]
+    assert dispositivo.ips_masks == {"g0": ("10.0.0.1", "255.255.255.0")}
+
+    responder(monkeypatch, [
+        "R1", "m", "3", " g0", "10.0.0.2", "24", "fin", "SSH", "",
+    ])
+    administrador.modificar_dispositivo("A")
+    assert dispositivo.interfaces == ["g0"]
+    assert dispositivo.ips_masks == {"g0": ("10.0.0.2", "255.255.255.0")}
+    asignador = administrador.obtener_asignador()
+    assert not asignador.esta_usada("10.0.0.1", "255.255.255.0")
+
+    responder(monkeypatch, ["R1", ""])
+    administrador.borrar_dispositivo("A")
+    assert asignador.por_campus == {}
+    assert asignador.obtener_subred("10.0.0.0/24").usadas == 0
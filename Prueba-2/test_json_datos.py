@@ -0,0 +1,107 @@
+"""Pruebas de la capa JSON y de la carga y guardado de AdministradorRedes."""
+import importlib.util
+import os
+
+import pytest
+
+RUTA_MODULO = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Lineas-de-codigo-prueba-2.py")
+especificacion = importlib.util.spec_from_file_location("administrador_redes", RUTA_MODULO)
+redes = importlib.util.module_from_spec(especificacion)
+especificacion.loader.exec_module(redes)
+
+MOTORES = ["json"] + [motor for motor in ("orjson", "ujson") if getattr(redes, motor) is not None]
+
+@pytest.fixture(params=MOTORES)
+def motor(request, monkeypatch):
+    """Ejecuta la prueba con cada biblioteca JSON instalada."""
+    monkeypatch.setattr(redes, "MOTOR_JSON", request.param)
+    return request.param
+
+def crear_administrador(nombre_archivo, indentar=False):
+    administrador = redes.AdministradorRedes(str(nombre_archivo), indentar=indentar)
+    campus = administrador.campus["Central"] = redes.Campus("Central", "Sede ñandú")
+    campus.dispositivos.append(redes.Dispositivo(
+        nombre="R1",
+        modelo="Cisco 4331",
+        capa="Núcleo",
+        interfaces=["Gi0/0", "Gi0/1"],
+        ips_masks={"Gi0/0": ("10.0.0.1", "255.255.255.0"), "Gi0/1": ("2001:db8::1", "ffff:ffff:ffff:ffff::")},
+        vlans={"Datos": 10},
+        servicios=["DHCP", "SSH"],
+    ))
+    return administrador
+
+def escribir(ruta, contenido):
+    ruta.write_bytes(contenido.encode("utf-8"))
+    return str(ruta)
+
+@pytest.mark.parametrize("indentar", [False, True])
+def test_guardar_y_cargar_conserva_los_datos(tmp_path, motor, indentar):
+    archivo = tmp_path / "datos.json"
+    assert crear_administrador(archivo, indentar).guardar_en_archivo()
+    contenido = archivo.read_bytes()
+    assert (b"\n" in contenido) == indentar
+    assert b"Gi0/0" in contenido and b"\\/" not in contenido
+
+    cargado = redes.AdministradorRedes(str(archivo))
+    assert list(cargado.campus) == ["Central"]
+    assert cargado.campus["Central"].descripcion == "Sede ñandú"
+    dispositivo = cargado.campus["Central"].dispositivos[0]
+    assert isinstance(dispositivo, redes.Dispositivo)
+    assert vars(dispositivo) == {
+        "nombre": "R1",
+        "modelo": "Cisco 4331",
+        "capa": "Núcleo",
+        "interfaces": ["Gi0/0", "Gi0/1"],
+        "ips_masks": {"Gi0/0": ["10.0.0.1", "255.255.255.0"], "Gi0/1": ["2001:db8::1", "ffff:ffff:ffff:ffff::"]},
+        "vlans": {"Datos": 10},
+        "servicios": ["DHCP", "SSH"],
+    }
+
+def test_codificar_y_decodificar_json(motor):
+    datos = {"a": [1, "ñ", {"b": None}]}
+    assert redes.decodificar_json(redes.codificar_json(datos)) == datos
+    assert redes.decodificar_json(redes.codificar_json(datos, indentar=True)) == datos
+    assert redes.codificar_json(datos) == '{"a":[1,"ñ",{"b":null}]}'.encode("utf-8")
+    with pytest.raises(ValueError):
+        redes.decodificar_json(b"{no es json")
+
+def test_error_al_codificar_no_modifica_el_archivo(tmp_path, capsys, motor):
+    archivo = tmp_path / "datos.json"
+    administrador = crear_administrador(archivo)
+    assert administrador.guardar_en_archivo()
+    original = archivo.read_bytes()
+
+    administrador.campus["Central"].dispositivos[0].vlans["Datos"] = {10}  # Ningún motor codifica conjuntos
+    assert not administrador.guardar_en_archivo()
+    assert archivo.read_bytes() == original
+    assert "no se modificó" in capsys.readouterr().out
+    assert os.listdir(tmp_path) == ["datos.json"]
+
+def test_esquema_informa_campos_faltantes():
+    with pytest.raises(KeyError, match="Faltan campos en Dispositivo: capa, servicios"):
+        redes.ESQUEMA_DISPOSITIVO.construir({
+            "nombre": "R1", "modelo": "m", "interfaces": [], "ips_masks": {}, "vlans": {},
+        })
+
+def test_esquema_informa_campos_desconocidos():
+    with pytest.raises(KeyError, match="Campos desconocidos en Dispositivo: color"):
+        redes.ESQUEMA_DISPOSITIVO.construir({
+            "nombre": "R1", "modelo": "m", "capa": "Acceso", "interfaces": [], "ips_masks": {},
+            "vlans": {}, "servicios": [], "color": "azul",
+        })
+
+def test_esquema_rechaza_entradas_que_no_son_objetos():
+    with pytest.raises(ValueError, match="Se esperaba un objeto JSON para Dispositivo"):
+        redes.ESQUEMA_DISPOSITIVO.construir(["R1"])
+
+@pytest.mark.parametrize("contenido", [
+    "{no es json",
+    "[1, 2]",
+    '{"campus": {"Central": "d"}, "Central": [{"nombre": "R1"}]}',
+    '{"campus": {"Central": "d"}, "Central": ["R1"]}',
+])
+def test_archivo_mal_formado_se_informa_sin_detener_el_programa(tmp_path, capsys, contenido):
+    archivo = escribir(tmp_path / "datos.json", contenido)
+    redes.AdministradorRedes(archivo)
+    assert f"Error al leer el archivo {archivo}" in capsys.readouterr().out